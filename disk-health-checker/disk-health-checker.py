@@ -8,11 +8,17 @@ __github__ = "https://github.com/gsaronni/disk-health-checker"
 Disk Health Checker - SMART Analysis Tool
 Analyzes disk health via smartctl and provides actionable recommendations
 
+Only identity, overall health, capabilities and the attribute table are read
+(smartctl -i -H -c -A). Error and self-test logs are not queried, since every
+extra log costs synchronous ATA commands on the disk and is not analyzed.
+
 Usage:
     sudo ./disk-health-checker.py           # Check all disks
     sudo ./disk-health-checker.py -v        # Verbose mode
     sudo ./disk-health-checker.py -q        # Quiet (summary only)
     sudo ./disk-health-checker.py --critical # Critical issues only
+    sudo ./disk-health-checker.py -j 4      # Query at most 4 disks at once
+    sudo ./disk-health-checker.py --cache-ttl 3600 # Reuse SMART data up to 1h old
 
 Exit Codes:
     0 = All disks healthy
@@ -25,11 +31,16 @@ import sys
 import re
 import subprocess
 import json
+import functools
+import time
+import shutil
+import tempfile
 from datetime import datetime
-from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 import argparse
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 try:
     from rich.console import Console
@@ -164,10 +175,29 @@ ATTRIBUTE_RULES = {
     ),
 }
 
+# Rules that can raise an issue - informational entries (Power_On_Hours,
+# Temperature_Celsius) are only displayed, so analysis never visits them
+_ACTIVE_RULES = {
+    attr_id: rule for attr_id, rule in ATTRIBUTE_RULES.items()
+    if rule.check_normalized or rule.check_raw
+}
+
+# Active rules applicable to each disk type, resolved once instead of per disk
+_RULES_BY_TYPE = {
+    "HDD": {attr_id: rule for attr_id, rule in _ACTIVE_RULES.items() if not rule.ssd_only},
+    "SSD": {attr_id: rule for attr_id, rule in _ACTIVE_RULES.items() if not rule.hdd_only},
+    "NVMe": {attr_id: rule for attr_id, rule in _ACTIVE_RULES.items()
+             if not rule.hdd_only and not rule.ssd_only},
+}
+
 # ============================================================================
 # DATA STRUCTURES
 # ============================================================================
 
+# ATA attribute IDs are a single byte, so attributes are stored in a list
+# indexed by ID (None where the disk does not report that attribute)
+ATTRIBUTE_SLOTS = 256
+
 @dataclass
 class SmartAttribute:
     """SMART attribute data"""
@@ -181,6 +211,16 @@ class SmartAttribute:
     updated: str
     when_failed: str
     raw_value: str
+    raw_int: int = -1  # Leading integer of raw_value, -1 if not numeric
+
+@dataclass(slots=True)
+class Issue:
+    """Problem found on a disk, with explanation and recommended action"""
+    severity: str  # WARNING, CRITICAL
+    attribute: str
+    value: str
+    explanation: str
+    action: str
 
 @dataclass
 class DiskInfo:
@@ -193,64 +233,204 @@ class DiskInfo:
     rotation_rate: str
     smart_enabled: bool
     smart_health: str
-    attributes: Dict[int, SmartAttribute]
+    attributes: List[Optional[SmartAttribute]]  # Indexed by attribute ID
     overall_status: str  # HEALTHY, WARNING, CRITICAL
-    issues: List[Dict]
+    issues: List[Issue]
     power_on_hours: int = 0
     temperature: int = 0
+    manufacturer: str = ""
+
+@dataclass
+class Summary:
+    """Status counts across all checked disks"""
+    healthy: int
+    warning: int
+    critical: int
+    critical_disks: List[DiskInfo]
+    warning_disks: List[DiskInfo]
+    
+    @property
+    def exit_code(self) -> int:
+        """0 = all healthy, 1 = warnings, 2 = critical issues"""
+        if self.critical:
+            return 2
+        elif self.warning:
+            return 1
+        else:
+            return 0
 
 # ============================================================================
 # DISK DISCOVERY
 # ============================================================================
 
+# Whole SATA/SAS (sd*) and NVMe disks - no partitions, loop or dm devices
+_DISK_NAME_RE = re.compile(r"^(sd[a-z]|nvme[0-9]n[0-9])$")
+
 def discover_disks() -> List[str]:
     """Discover all physical disks (exclude partitions, loop, dm-crypt)"""
-    disks = []
-    
-    # Find SATA/SAS disks (sd*)
-    for device in Path("/dev").glob("sd[a-z]"):
-        disks.append(str(device))
-    
-    # Find NVMe disks
-    for device in Path("/dev").glob("nvme[0-9]n[0-9]"):
-        disks.append(str(device))
-    
-    return sorted(disks)
+    with os.scandir("/dev") as entries:
+        return sorted(f"/dev/{entry.name}" for entry in entries if _DISK_NAME_RE.match(entry.name))
 
 # ============================================================================
 # SMART DATA PARSING
 # ============================================================================
 
-def run_smartctl(device: str, timeout: int = 10) -> Optional[str]:
-    """Run smartctl with timeout and error handling"""
+# Sections actually used by the analysis - cheaper than -a, which also reads the logs
+SMARTCTL_ARGS = ["-i", "-H", "-c", "-A"]
+
+def run_smartctl(device: str, timeout: int = 10) -> Optional[bytes]:
+    """Run smartctl with timeout and error handling (returns undecoded stdout)"""
     try:
         result = subprocess.run(
-            ["smartctl", "-a", device],
+            ["smartctl", "-j", *SMARTCTL_ARGS, device],
             capture_output=True,
-            text=True,
             timeout=timeout
         )
+        # smartmontools < 7.0 has no JSON output - retry in text mode
+        if not result.stdout.lstrip().startswith(b"{"):
+            result = subprocess.run(
+                ["smartctl", *SMARTCTL_ARGS, device],
+                capture_output=True,
+                timeout=timeout
+            )
         return result.stdout
     except subprocess.TimeoutExpired:
         console.print(f"[yellow]⏱  Timeout reading {device} (>{timeout}s)[/yellow]")
         return None
-    except FileNotFoundError:
-        console.print("[red]ERROR: smartctl not found. Install smartmontools[/red]")
-        sys.exit(1)
     except Exception as e:
         console.print(f"[yellow]⚠  Error reading {device}: {e}[/yellow]")
         return None
 
-def parse_smart_output(device: str, output: str) -> Optional[DiskInfo]:
-    """Parse smartctl output into structured data"""
+def parse_raw_int(raw_value: str) -> int:
+    """Parse the leading integer of a RAW_VALUE string, -1 if not numeric"""
+    try:
+        return int(raw_value.split(None, 1)[0])
+    except (ValueError, IndexError):
+        return -1
+
+def format_capacity(num_bytes: int) -> str:
+    """Format a byte count the way smartctl does (e.g. 16.0 TB, 500 GB)
+
+    smartctl truncates to 3 significant digits using integer math, so
+    999999999999 bytes is "999 GB", never a rounded-up "1000 GB"
+    """
+    units = ("bytes", "kB", "MB", "GB", "TB", "PB", "EB")
+    divisor = 1
+    unit = 0
+    while unit < len(units) - 1 and num_bytes >= divisor * 1000:
+        divisor *= 1000
+        unit += 1
+    if unit == 0:
+        return f"{num_bytes} bytes"
+    whole, rem = divmod(num_bytes, divisor)
+    if whole >= 100:
+        return f"{whole} {units[unit]}"
+    elif whole >= 10:
+        return f"{whole}.{rem * 10 // divisor} {units[unit]}"
+    return f"{whole}.{rem * 100 // divisor:02d} {units[unit]}"
+
+def parse_smart_json(data: dict) -> Tuple[Dict[str, str], bool, List[Optional[SmartAttribute]]]:
+    """Extract header fields, SMART state and attributes from smartctl -j output"""
+    fields = {}
+    if "model_name" in data:
+        fields["model"] = data["model_name"]
+    if "serial_number" in data:
+        fields["serial"] = data["serial_number"]
+    if "bytes" in data.get("user_capacity", {}):
+        fields["capacity"] = format_capacity(data["user_capacity"]["bytes"])
+    if "rotation_rate" in data:
+        rpm = data["rotation_rate"]
+        fields["rotation"] = f"{rpm} rpm" if rpm else "Solid State Device"
+    if "passed" in data.get("smart_status", {}):
+        fields["health"] = "PASSED" if data["smart_status"]["passed"] else "FAILED"
+    smart_enabled = data.get("smart_support", {}).get("enabled", False)
+    
+    attributes = [None] * ATTRIBUTE_SLOTS
+    for entry in data.get("ata_smart_attributes", {}).get("table", []):
+        if not 0 <= entry["id"] < ATTRIBUTE_SLOTS:
+            continue
+        flags = entry.get("flags", {})
+        attributes[entry["id"]] = SmartAttribute(
+            id=entry["id"],
+            name=entry["name"],
+            flag=f"0x{flags.get('value', 0):04x}",
+            value=entry["value"],
+            worst=entry["worst"],
+            thresh=entry["thresh"],
+            type="Pre-fail" if flags.get("prefailure") else "Old_age",
+            updated="Always" if flags.get("updated_online") else "Offline",
+            when_failed=entry.get("when_failed") or "-",
+            raw_value=entry["raw"]["string"],
+            raw_int=parse_raw_int(entry["raw"]["string"])
+        )
     
-    # Extract basic info
-    model = re.search(r"Device Model:\s+(.+)", output)
-    serial = re.search(r"Serial Number:\s+(.+)", output)
-    capacity = re.search(r"User Capacity:\s+[\d,]+ bytes \[(.+?)\]", output)
-    rotation = re.search(r"Rotation Rate:\s+(.+)", output)
-    smart_enabled = "SMART support is: Enabled" in output
-    smart_health = re.search(r"SMART overall-health.*:\s+(\w+)", output)
+    return fields, smart_enabled, attributes
+
+# Header fields, matched in a single pass over the smartctl output
+_HEADER_RE = re.compile(
+    rb"Device Model:\s+(?P<model>.+)"
+    rb"|Serial Number:\s+(?P<serial>.+)"
+    rb"|User Capacity:\s+[\d,]+ bytes \[(?P<capacity>.+?)\]"
+    rb"|Rotation Rate:\s+(?P<rotation>.+)"
+    rb"|SMART overall-health.*:\s+(?P<health>\w+)",
+    re.MULTILINE
+)
+
+def parse_smart_text(output: bytes) -> Tuple[Dict[str, str], bool, List[Optional[SmartAttribute]]]:
+    """Extract header fields, SMART state and attributes from plain smartctl output"""
+    
+    # Extract basic info (first occurrence of each field wins)
+    fields = {}
+    for match in _HEADER_RE.finditer(output):
+        name = match.lastgroup
+        if name not in fields:
+            fields[name] = match.group(name).decode(errors="replace")
+    smart_enabled = b"SMART support is: Enabled" in output
+    
+    # Parse SMART attributes table (runs until a blank line or the error log)
+    attributes = [None] * ATTRIBUTE_SLOTS
+    lines = output.splitlines()
+    start = next((i for i, line in enumerate(lines) if line.startswith(b"ID# ATTRIBUTE_NAME")), None)
+    
+    if start is not None:
+        for line in lines[start + 1:]:
+            if not line.strip() or line.startswith(b"SMART Error Log"):
+                break
+            # Only the attribute rows are decoded, not the whole output
+            parts = line.decode(errors="replace").split(None, 9)
+            if len(parts) == 10 and parts[0].isdigit() and int(parts[0]) < ATTRIBUTE_SLOTS:
+                attr_id = int(parts[0])
+                raw_value = parts[9].rstrip()
+                attributes[attr_id] = SmartAttribute(
+                    id=attr_id,
+                    name=parts[1],
+                    flag=parts[2],
+                    value=int(parts[3]),
+                    worst=int(parts[4]),
+                    thresh=int(parts[5]),
+                    type=parts[6],
+                    updated=parts[7],
+                    when_failed=parts[8],
+                    raw_value=raw_value,
+                    raw_int=parse_raw_int(raw_value)
+                )
+    
+    return fields, smart_enabled, attributes
+
+def parse_smart_output(device: str, output: bytes) -> Optional[DiskInfo]:
+    """Parse smartctl output (JSON, or plain text from older smartctl) into structured data"""
+    
+    data = None
+    if output.lstrip().startswith(b"{"):
+        try:
+            data = json.loads(output)
+        except ValueError:
+            pass
+    
+    if data is not None:
+        fields, smart_enabled, attributes = parse_smart_json(data)
+    else:
+        fields, smart_enabled, attributes = parse_smart_text(output)
     
     if not smart_enabled:
         console.print(f"[yellow]⚠  {device}: SMART not supported - skipping[/yellow]")
@@ -259,186 +439,237 @@ def parse_smart_output(device: str, output: str) -> Optional[DiskInfo]:
     # Determine disk type
     disk_type = "HDD"
     rotation_rate = "Unknown"
-    if rotation:
-        rotation_rate = rotation.group(1)
+    if "rotation" in fields:
+        rotation_rate = fields["rotation"]
         if "Solid State Device" in rotation_rate or "SSD" in rotation_rate:
             disk_type = "SSD"
     if "nvme" in device:
         disk_type = "NVMe"
         rotation_rate = "N/A (NVMe)"
     
-    # Parse SMART attributes table
-    attributes = {}
-    attr_section = re.search(
-        r"ID# ATTRIBUTE_NAME.*?\n(.*?)(?:\n\n|SMART Error Log)",
-        output,
-        re.DOTALL
-    )
-    
-    if attr_section:
-        for line in attr_section.group(1).strip().split('\n'):
-            parts = line.split()
-            if len(parts) >= 10 and parts[0].isdigit():
-                attr_id = int(parts[0])
-                attributes[attr_id] = SmartAttribute(
-                    id=attr_id,
-                    name=parts[1],
-                    flag=parts[2],
-                    value=int(parts[3]),
-                    worst=int(parts[4]),
-                    thresh=int(parts[5]),
-                    type=parts[6],
-                    updated=parts[7],
-                    when_failed=parts[8],
-                    raw_value=' '.join(parts[9:])
-                )
-    
     # Extract power-on hours and temperature
     power_on_hours = 0
     temperature = 0
-    if 9 in attributes:
-        try:
-            power_on_hours = int(attributes[9].raw_value.split()[0])
-        except (ValueError, IndexError):
-            pass
-    if 194 in attributes:
-        try:
-            temperature = int(attributes[194].raw_value.split()[0])
-        except (ValueError, IndexError):
-            pass
+    if attributes[9] is not None and attributes[9].raw_int >= 0:
+        power_on_hours = attributes[9].raw_int
+    if attributes[194] is not None and attributes[194].raw_int >= 0:
+        temperature = attributes[194].raw_int
+    
+    model = fields.get("model", "Unknown")
     
     return DiskInfo(
         device=device,
-        model=model.group(1) if model else "Unknown",
-        serial=serial.group(1) if serial else "Unknown",
-        capacity=capacity.group(1) if capacity else "Unknown",
+        model=model,
+        serial=fields.get("serial", "Unknown"),
+        capacity=fields.get("capacity", "Unknown"),
         disk_type=disk_type,
         rotation_rate=rotation_rate,
         smart_enabled=smart_enabled,
-        smart_health=smart_health.group(1) if smart_health else "UNKNOWN",
+        smart_health=fields.get("health", "UNKNOWN"),
         attributes=attributes,
         overall_status="HEALTHY",
         issues=[],
         power_on_hours=power_on_hours,
-        temperature=temperature
+        temperature=temperature,
+        manufacturer=detect_manufacturer(model)
     )
 
+# ============================================================================
+# SMART DATA CACHE
+# ============================================================================
+
+CACHE_DIR = "/var/cache/disk-health-checker"
+
+def cache_path(device: str) -> str:
+    """Cache file holding the last smartctl output (JSON or text) for a device"""
+    return os.path.join(CACHE_DIR, f"{os.path.basename(device)}.out")
+
+def load_cached_output(device: str, ttl: int) -> Optional[bytes]:
+    """Return cached smartctl output if younger than ttl seconds, else None"""
+    path = cache_path(device)
+    try:
+        mtime = os.stat(path).st_mtime
+        # A device node recreated after the cache was written (hotplug,
+        # reboot) may be a different disk - treat the cache as stale
+        if time.time() - mtime >= ttl or os.stat(device).st_ctime > mtime:
+            return None
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+def store_cached_output(device: str, output: bytes) -> None:
+    """Write smartctl output to the cache (best effort, errors are ignored)"""
+    path = cache_path(device)
+    tmp_path = None
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # Unique temp file, so overlapping runs never write into the same one
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, prefix=f"{os.path.basename(device)}.", suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(output)
+        os.replace(tmp_path, path)
+    except OSError:
+        if tmp_path:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+def read_smart_data(device: str, cache_ttl: int = 0) -> Tuple[Optional[bytes], bool]:
+    """Get smartctl output for a device, from the cache when fresh enough
+
+    Returns (output, from_cache). Fresh output is not cached here - the caller
+    stores it only once it parsed into a disk with SMART enabled, so failed
+    probes are never replayed from the cache.
+    """
+    if cache_ttl > 0:
+        cached = load_cached_output(device, cache_ttl)
+        if cached:
+            return cached, True
+    return run_smartctl(device), False
+
 # ============================================================================
 # HEALTH ANALYSIS
 # ============================================================================
 
+# Model prefixes per vendor; the longest matching prefix wins
+_MANUFACTURER_PREFIXES = {
+    "ST": "Seagate",
+    "WDC": "Western Digital",
+    "WD": "Western Digital",
+    "TOSHIBA": "Toshiba",
+    "Toshiba": "Toshiba",
+    "HGST": "HGST/Hitachi",
+    "Hitachi": "HGST/Hitachi",
+}
+
+# Vendors whose name can appear anywhere in the model string
+_MANUFACTURER_SUBSTRINGS = (
+    ("Samsung", "Samsung"),
+    ("Crucial", "Micron"),
+    ("Micron", "Micron"),
+)
+
+@functools.lru_cache(maxsize=64)
 def detect_manufacturer(model: str) -> str:
     """Detect disk manufacturer from model string"""
-    if model.startswith("ST"):
-        return "Seagate"
-    elif model.startswith("WDC") or model.startswith("WD"):
-        return "Western Digital"
-    elif model.startswith("TOSHIBA") or model.startswith("Toshiba"):
-        return "Toshiba"
-    elif "Samsung" in model:
-        return "Samsung"
-    elif "Crucial" in model or "Micron" in model:
-        return "Micron"
-    elif model.startswith("HGST") or model.startswith("Hitachi"):
-        return "HGST/Hitachi"
-    return "Unknown"
+    head = model[:7]
+    prefix = max((p for p in _MANUFACTURER_PREFIXES if head.startswith(p)), key=len, default=None)
+    if prefix:
+        return _MANUFACTURER_PREFIXES[prefix]
+    return next((name for s, name in _MANUFACTURER_SUBSTRINGS if s in model), "Unknown")
+
+def _check_normalized_value(disk: DiskInfo, attr: SmartAttribute, rule: AttributeRule) -> bool:
+    """Check the normalized VALUE against the rule, return True if CRITICAL was raised"""
+    
+    # Special handling for Seagate Raw_Read_Error_Rate (ID 1)
+    # Seagate enterprise drives start at 80-90, not 100
+    # Check headroom from threshold instead of absolute value
+    if attr.id == 1 and disk.manufacturer == "Seagate":
+        headroom = attr.value - attr.thresh
+        if headroom < 10:
+            disk.issues.append(Issue(
+                severity="CRITICAL",
+                attribute=attr.name,
+                value=f"VALUE={attr.value} (headroom: {headroom} from THRESH={attr.thresh})",
+                explanation="Approaching failure threshold - excessive read errors",
+                action=rule.action_critical
+            ))
+            disk.overall_status = "CRITICAL"
+            return True
+        elif headroom < 20:
+            disk.issues.append(Issue(
+                severity="WARNING",
+                attribute=attr.name,
+                value=f"VALUE={attr.value} (headroom: {headroom} from THRESH={attr.thresh})",
+                explanation="Read error rate increasing but still acceptable for Seagate",
+                action="Monitor monthly, verify backups exist"
+            ))
+            if disk.overall_status == "HEALTHY":
+                disk.overall_status = "WARNING"
+        # If headroom >= 20, it's healthy - don't flag it
+        return False
+    
+    # Standard normalized value checks for other attributes
+    if attr.value <= rule.normalized_threshold:
+        disk.issues.append(Issue(
+            severity="CRITICAL",
+            attribute=attr.name,
+            value=f"VALUE={attr.value}",
+            explanation=rule.explanation_critical,
+            action=rule.action_critical
+        ))
+        disk.overall_status = "CRITICAL"
+        return True
+    elif attr.value <= rule.normalized_warning and disk.overall_status != "CRITICAL":
+        disk.issues.append(Issue(
+            severity="WARNING",
+            attribute=attr.name,
+            value=f"VALUE={attr.value}",
+            explanation=rule.explanation_warning,
+            action=rule.action_warning
+        ))
+        if disk.overall_status == "HEALTHY":
+            disk.overall_status = "WARNING"
+    return False
+
+def _check_raw_value(disk: DiskInfo, attr: SmartAttribute, rule: AttributeRule) -> bool:
+    """Check the RAW_VALUE against the rule, return True if CRITICAL was raised"""
+    if attr.raw_int > rule.raw_threshold:  # raw_int is -1 when not numeric
+        disk.issues.append(Issue(
+            severity="CRITICAL",
+            attribute=attr.name,
+            value=f"RAW={attr.raw_int}",
+            explanation=rule.explanation_critical,
+            action=rule.action_critical
+        ))
+        disk.overall_status = "CRITICAL"
+        return True
+    return False
+
+# Per disk type: (attr_id, rule, checks) with the check_normalized/check_raw
+# flags already resolved into the list of checks to run
+_ANALYSIS_PLANS = {
+    disk_type: tuple(
+        (attr_id, rule, tuple(
+            check for check, enabled in ((_check_normalized_value, rule.check_normalized),
+                                         (_check_raw_value, rule.check_raw))
+            if enabled
+        ))
+        for attr_id, rule in rules.items()
+    )
+    for disk_type, rules in _RULES_BY_TYPE.items()
+}
 
 def analyze_disk(disk: DiskInfo) -> None:
     """Analyze disk attributes and populate issues list"""
     
-    manufacturer = detect_manufacturer(disk.model)
-    
-    for attr_id, rule in ATTRIBUTE_RULES.items():
-        if attr_id not in disk.attributes:
-            continue
-        
+    for attr_id, rule, checks in _ANALYSIS_PLANS[disk.disk_type]:
         attr = disk.attributes[attr_id]
-        
-        # Skip disk-type specific checks
-        if rule.hdd_only and disk.disk_type != "HDD":
+        if attr is None:
             continue
-        if rule.ssd_only and disk.disk_type != "SSD":
-            continue
-        
-        # Check normalized value
-        if rule.check_normalized:
-            # Special handling for Seagate Raw_Read_Error_Rate (ID 1)
-            # Seagate enterprise drives start at 80-90, not 100
-            # Check headroom from threshold instead of absolute value
-            if attr_id == 1 and manufacturer == "Seagate":
-                headroom = attr.value - attr.thresh
-                if headroom < 10:
-                    disk.issues.append({
-                        "severity": "CRITICAL",
-                        "attribute": attr.name,
-                        "value": f"VALUE={attr.value} (headroom: {headroom} from THRESH={attr.thresh})",
-                        "explanation": "Approaching failure threshold - excessive read errors",
-                        "action": rule.action_critical
-                    })
-                    disk.overall_status = "CRITICAL"
-                elif headroom < 20:
-                    disk.issues.append({
-                        "severity": "WARNING",
-                        "attribute": attr.name,
-                        "value": f"VALUE={attr.value} (headroom: {headroom} from THRESH={attr.thresh})",
-                        "explanation": "Read error rate increasing but still acceptable for Seagate",
-                        "action": "Monitor monthly, verify backups exist"
-                    })
-                    if disk.overall_status == "HEALTHY":
-                        disk.overall_status = "WARNING"
-                # If headroom >= 20, it's healthy - don't flag it
-            else:
-                # Standard normalized value checks for other attributes
-                if attr.value <= rule.normalized_threshold:
-                    disk.issues.append({
-                        "severity": "CRITICAL",
-                        "attribute": attr.name,
-                        "value": f"VALUE={attr.value}",
-                        "explanation": rule.explanation_critical,
-                        "action": rule.action_critical
-                    })
-                    disk.overall_status = "CRITICAL"
-                elif attr.value <= rule.normalized_warning and disk.overall_status != "CRITICAL":
-                    disk.issues.append({
-                        "severity": "WARNING",
-                        "attribute": attr.name,
-                        "value": f"VALUE={attr.value}",
-                        "explanation": rule.explanation_warning,
-                        "action": rule.action_warning
-                    })
-                    if disk.overall_status == "HEALTHY":
-                        disk.overall_status = "WARNING"
         
-        # Check raw value
-        if rule.check_raw:
-            try:
-                raw_val = int(attr.raw_value.split()[0])
-                if raw_val > rule.raw_threshold:
-                    disk.issues.append({
-                        "severity": "CRITICAL",
-                        "attribute": attr.name,
-                        "value": f"RAW={raw_val}",
-                        "explanation": rule.explanation_critical,
-                        "action": rule.action_critical
-                    })
-                    disk.overall_status = "CRITICAL"
-            except (ValueError, IndexError):
-                pass
+        # A CRITICAL from the normalized check makes the raw check redundant
+        for check in checks:
+            if check(disk, attr, rule):
+                break
 
 # ============================================================================
 # OUTPUT FORMATTING
 # ============================================================================
 
+# Status emoji and color
+STATUS_MAP = {
+    "HEALTHY": ("✅", "green"),
+    "WARNING": ("⚠️ ", "yellow"),
+    "CRITICAL": ("❌", "red")
+}
+
 def format_disk_report(disk: DiskInfo, verbose: bool = False) -> None:
     """Print detailed disk report"""
     
-    # Status emoji and color
-    status_map = {
-        "HEALTHY": ("✅", "green"),
-        "WARNING": ("⚠️ ", "yellow"),
-        "CRITICAL": ("❌", "red")
-    }
-    emoji, color = status_map.get(disk.overall_status, ("❓", "white"))
+    emoji, color = STATUS_MAP.get(disk.overall_status, ("❓", "white"))
     
     # Header
     header = f"{disk.device} - {disk.model} ({disk.capacity})"
@@ -447,34 +678,54 @@ def format_disk_report(disk: DiskInfo, verbose: bool = False) -> None:
     
     # Basic info
     age_years = disk.power_on_hours / 8760
-    console.print(f"Type: {disk.disk_type} | Power-On: {disk.power_on_hours:,}h ({age_years:.1f} years) | Temp: {disk.temperature}°C")
-    console.print(f"SMART Health: [{color}]{disk.smart_health}[/{color}] | Our Analysis: [{color}]{disk.overall_status}[/{color}]")
+    console.print(
+        f"Type: {disk.disk_type} | Power-On: {disk.power_on_hours:,}h ({age_years:.1f} years) | Temp: {disk.temperature}°C\n"
+        f"SMART Health: [{color}]{disk.smart_health}[/{color}] | Our Analysis: [{color}]{disk.overall_status}[/{color}]"
+    )
     
-    # Issues
+    # Issues (one print per issue)
     if disk.issues:
         console.print()
         for issue in disk.issues:
-            sev_color = "red" if issue["severity"] == "CRITICAL" else "yellow"
-            console.print(f"[{sev_color}]{'🚨' if issue['severity'] == 'CRITICAL' else '⚠️ '} {issue['attribute']} ({issue['value']})[/{sev_color}]")
-            console.print(f"   ├─ {issue['explanation']}")
-            console.print(f"   └─ Action: {issue['action']}")
+            sev_color = "red" if issue.severity == "CRITICAL" else "yellow"
+            icon = "🚨" if issue.severity == "CRITICAL" else "⚠️ "
+            console.print(
+                f"[{sev_color}]{icon} {issue.attribute} ({issue.value})[/{sev_color}]\n"
+                f"   ├─ {issue.explanation}\n"
+                f"   └─ Action: {issue.action}"
+            )
     else:
         console.print("[green]✓ All monitored attributes healthy[/green]")
     
     # Verbose: show all attributes
-    if verbose and disk.attributes:
+    if verbose and any(disk.attributes):
         console.print("\n[dim]Monitored Attributes:[/dim]")
         for attr_id in sorted(ATTRIBUTE_RULES.keys()):
-            if attr_id in disk.attributes:
-                attr = disk.attributes[attr_id]
+            attr = disk.attributes[attr_id]
+            if attr is not None:
                 console.print(f"  {attr.name:25s} VALUE={attr.value:3d} RAW={attr.raw_value}")
 
-def print_summary(disks: List[DiskInfo]) -> int:
-    """Print overall summary and return exit code"""
-    
-    healthy = sum(1 for d in disks if d.overall_status == "HEALTHY")
-    warning = sum(1 for d in disks if d.overall_status == "WARNING")
-    critical = sum(1 for d in disks if d.overall_status == "CRITICAL")
+def summarize(disks: List[DiskInfo]) -> Summary:
+    """Count disks per status and collect the ones needing action"""
+    counts = Counter(d.overall_status for d in disks)
+    return Summary(
+        healthy=counts["HEALTHY"],
+        warning=counts["WARNING"],
+        critical=counts["CRITICAL"],
+        critical_disks=[d for d in disks if d.overall_status == "CRITICAL"],
+        warning_disks=[d for d in disks if d.overall_status == "WARNING"]
+    )
+
+def print_quiet_summary(summary: Summary) -> None:
+    """Print plain summary (no Rich rendering)"""
+    print(f"Healthy: {summary.healthy} | Warning: {summary.warning} | Critical: {summary.critical}")
+    for disk in summary.critical_disks:
+        print(f"  {disk.device}: REPLACE WITHIN 24-48H")
+    for disk in summary.warning_disks:
+        print(f"  {disk.device}: Monitor/test, replace in 1-4 weeks")
+
+def print_summary(summary: Summary) -> None:
+    """Print overall summary"""
     
     console.print("\n")
     console.rule("[bold]SUMMARY[/bold]")
@@ -483,30 +734,19 @@ def print_summary(disks: List[DiskInfo]) -> int:
     summary_table.add_column(style="bold")
     summary_table.add_column()
     
-    summary_table.add_row("✅ Healthy", f"{healthy} disk(s)")
-    summary_table.add_row("⚠️  Warning", f"{warning} disk(s)")
-    summary_table.add_row("❌ Critical", f"{critical} disk(s)")
+    summary_table.add_row("✅ Healthy", f"{summary.healthy} disk(s)")
+    summary_table.add_row("⚠️  Warning", f"{summary.warning} disk(s)")
+    summary_table.add_row("❌ Critical", f"{summary.critical} disk(s)")
     
     console.print(summary_table)
     
     # Action items
-    critical_disks = [d for d in disks if d.overall_status == "CRITICAL"]
-    warning_disks = [d for d in disks if d.overall_status == "WARNING"]
-    
-    if critical_disks or warning_disks:
+    if summary.critical_disks or summary.warning_disks:
         console.print("\n[bold]Action Required:[/bold]")
-        for disk in critical_disks:
+        for disk in summary.critical_disks:
             console.print(f"  🚨 {disk.device}: REPLACE WITHIN 24-48H")
-        for disk in warning_disks:
+        for disk in summary.warning_disks:
             console.print(f"  ⚠️  {disk.device}: Monitor/test, replace in 1-4 weeks")
-    
-    # Determine exit code
-    if critical:
-        return 2
-    elif warning:
-        return 1
-    else:
-        return 0
 
 # ============================================================================
 # MAIN
@@ -522,6 +762,8 @@ Examples:
   sudo ./disk-health-checker.py -v        # Verbose (show all attributes)
   sudo ./disk-health-checker.py -q        # Quiet (summary only)
   sudo ./disk-health-checker.py --critical # Critical issues only
+  sudo ./disk-health-checker.py -j 4      # Query at most 4 disks at once
+  sudo ./disk-health-checker.py --cache-ttl 3600 # Reuse SMART data up to 1h old
 
 Exit Codes:
   0 = All disks healthy
@@ -532,33 +774,59 @@ Exit Codes:
     parser.add_argument("-v", "--verbose", action="store_true", help="Show all SMART attributes")
     parser.add_argument("-q", "--quiet", action="store_true", help="Summary only")
     parser.add_argument("--critical", action="store_true", help="Show only critical issues")
+    parser.add_argument("-j", "--jobs", type=int, default=None, metavar="N",
+                        help="Number of disks to query in parallel (default: all disks, up to 32)")
+    parser.add_argument("--cache-ttl", type=int, default=0, metavar="SEC",
+                        help=f"Reuse smartctl output cached in {CACHE_DIR} if younger than SEC seconds (default: 0, disabled)")
     
     args = parser.parse_args()
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.cache_ttl < 0:
+        parser.error("--cache-ttl must not be negative")
     
     # Root check
     if os.geteuid() != 0:
         console.print("[red]ERROR: Must run as root (use sudo)[/red]")
         sys.exit(1)
     
-    # Header
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
-    console.print(Panel.fit(
-        f"[bold]DISK HEALTH REPORT[/bold]\n{timestamp}",
-        border_style="blue"
-    ))
-    
-    # Discover and analyze disks
+    # Header (quiet mode skips all Rich rendering except warnings/errors)
     disk_paths = discover_disks()
-    console.print(f"\n🔍 Found {len(disk_paths)} disk(s): {', '.join(disk_paths)}\n")
+    if not args.quiet:
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
+        console.print(Panel.fit(
+            f"[bold]DISK HEALTH REPORT[/bold]\n{timestamp}",
+            border_style="blue"
+        ))
+        console.print(f"\n🔍 Found {len(disk_paths)} disk(s): {', '.join(disk_paths)}\n")
+    
+    # Checked once here - run_smartctl runs in worker threads and must not exit
+    if shutil.which("smartctl") is None:
+        console.print("[red]ERROR: smartctl not found. Install smartmontools[/red]")
+        sys.exit(1)
     
+    # smartctl blocks on slow ATA commands, so query all disks concurrently
+    # and parse/analyze each one on the main thread as soon as it finishes
     disks = []
-    for device in disk_paths:
-        output = run_smartctl(device)
-        if output:
-            disk_info = parse_smart_output(device, output)
-            if disk_info:
-                analyze_disk(disk_info)
-                disks.append(disk_info)
+    jobs = args.jobs or max(1, min(32, len(disk_paths)))
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(read_smart_data, device, args.cache_ttl): device for device in disk_paths}
+        for future in as_completed(futures):
+            device = futures[future]
+            output, from_cache = future.result()
+            if output:
+                disk_info = parse_smart_output(device, output)
+                if disk_info:
+                    if from_cache:
+                        if not args.quiet:
+                            console.print(f"[dim]{device}: using cached SMART data[/dim]")
+                    elif args.cache_ttl > 0:
+                        store_cached_output(device, output)
+                    analyze_disk(disk_info)
+                    disks.append(disk_info)
+    
+    # Report in discovery order, not completion order
+    disks.sort(key=lambda d: d.device)
     
     # Filter and display
     if args.critical:
@@ -569,9 +837,13 @@ Exit Codes:
             format_disk_report(disk, verbose=args.verbose)
     
     # Summary
-    exit_code = print_summary(disks)
+    summary = summarize(disks)
+    if args.quiet:
+        print_quiet_summary(summary)
+    else:
+        print_summary(summary)
     
-    sys.exit(exit_code)
+    sys.exit(summary.exit_code)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file